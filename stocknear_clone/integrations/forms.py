@@ -1,10 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
 import keyring
 from django import forms
 from .models import Integration
 
+# Keychain writes run off the request thread on a single worker, so saves land
+# in submission order; the executor is joined at interpreter exit, unlike a
+# daemon thread, so an acknowledged write isn't dropped on shutdown.
+_keyring_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keyring")
+
+def _kr_set(provider, username, pw):
+    try:
+        keyring.set_password(provider, username, pw)
+    except Exception as e:
+        print(f"Error writing keyring entry for {provider}:{username}: {e}")
+
+def _kr_copy(old_provider, old_username, provider, username):
+    """
+    Carry the existing secret over when an edit renames provider/username
+    without entering a new password.
+    """
+    try:
+        pw = keyring.get_password(old_provider, old_username)
+    except Exception as e:
+        print(f"Error reading keyring entry for {old_provider}:{old_username}: {e}")
+        return
+    if pw is not None:
+        _kr_set(provider, username, pw)
+
 class IntegrationForm(forms.ModelForm):
     password = forms.CharField(
-        widget=forms.PasswordInput(render_value=True),
+        widget=forms.PasswordInput(),
         required=True,
         help_text="API key or password"
     )
@@ -14,11 +39,14 @@ class IntegrationForm(forms.ModelForm):
         fields = ['provider', 'username']
 
     def __init__(self, *args, **kwargs):
-        # Pop initial password from keychain if existing
+        # The stored secret is never read back into the form: on edit the
+        # field is optional and a blank value keeps the current one
         super().__init__(*args, **kwargs)
+        self._stored_key = None
         if self.instance.pk:
-            pw = keyring.get_password(self.instance.provider, self.instance.username)
-            self.fields['password'].initial = pw
+            self._stored_key = (self.instance.provider, self.instance.username)
+            self.fields['password'].required = False
+            self.fields['password'].help_text = "API key or password (leave blank to keep the current one)"
 
     def save(self, commit=True):
         inst = super().save(commit=False)
@@ -27,5 +55,10 @@ class IntegrationForm(forms.ModelForm):
         inst.key_name = key_name
         if commit:
             inst.save()
-            keyring.set_password(inst.provider, inst.username, self.cleaned_data['password'])
+            pw = self.cleaned_data['password']
+            # write to the keychain off the request thread
+            if pw:
+                _keyring_writer.submit(_kr_set, inst.provider, inst.username, pw)
+            elif self._stored_key and self._stored_key != (inst.provider, inst.username):
+                _keyring_writer.submit(_kr_copy, *self._stored_key, inst.provider, inst.username)
         return inst
@@ -1,13 +1,18 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
+from django.http import Http404
+from django.utils import timezone
 from .models import Integration
 from .forms import IntegrationForm
 import keyring
-from stocks.views import stock_detail  # reuse quote fetch
+from stocks.views import fmp_probe
 
 @login_required
 def integration_list(request):
-    items = Integration.objects.filter(user=request.user)
+    # list.html only needs these columns and never dereferences item.user
+    items = Integration.objects.filter(user=request.user).only(
+        'id', 'provider', 'username', 'verified'
+    )
     return render(request, 'integrations/list.html', {'items': items})
 
 @login_required
@@ -27,13 +32,11 @@ def integration_edit(request, pk=None):
 
 @login_required
 def integration_verify(request, pk):
-    inst = get_object_or_404(Integration, pk=pk, user=request.user)
-    # attempt a quote fetch for AAPL via WebullManager or Robinhood logic
-    try:
-        # simplistic: call stock_detail view to get context
-        resp = stock_detail(request, 'AAPL')
-        inst.verified = True
-    except Exception:
-        inst.verified = False
-    inst.save()
+    integrations = Integration.objects.filter(pk=pk, user=request.user)
+    # check ownership before spending an upstream call on the probe
+    if not integrations.exists():
+        raise Http404("No Integration matches the given query.")
+    # attempt a cheap authenticated FMP call; only verified/updated_at are written
+    ok = fmp_probe()
+    integrations.update(verified=ok, updated_at=timezone.now())
     return redirect('integrations:list')
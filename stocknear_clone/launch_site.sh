@@ -10,7 +10,7 @@
 #   1. Ensures manage.py exists in the current directory.
 #   2. Checks if port 8000 is already in use. If so, it exits with an error.
 #   3. Activates the Python virtualenv (assumed at ./venv/).
-#   4. Launches "python manage.py runserver" in the background, logging to runserver.log.
+#   4. Launches the ASGI app under uvicorn in the background, logging to server.log.
 #   5. Waits briefly, then opens http://127.0.0.1:8000/ in your default macOS browser.
 #
 
@@ -48,14 +48,15 @@ echo "🟢  Activating virtualenv (${ACTIVATE_SCRIPT})..."
 # shellcheck disable=SC1091
 source "${ACTIVATE_SCRIPT}"
 
-# 4) Run the Django development server in the background
-LOGFILE="runserver.log"
-echo "🚀  Launching Django development server on port ${PORT} (logs → ${LOGFILE})..."
-python manage.py runserver 127.0.0.1:"${PORT}" >"${LOGFILE}" 2>&1 &
+# 4) Run the ASGI app under uvicorn in the background (the stock views are async,
+#    and only ASGI keeps one event loop alive for pooled upstream connections)
+LOGFILE="server.log"
+echo "🚀  Launching uvicorn on port ${PORT} (logs → ${LOGFILE})..."
+uvicorn stocknear.asgi:application --host 127.0.0.1 --port "${PORT}" --reload >"${LOGFILE}" 2>&1 &
 
 # Capture the PID so you can stop it later if needed
-RUNSERVER_PID=$!
-echo "    → runserver PID: ${RUNSERVER_PID}"
+SERVER_PID=$!
+echo "    → uvicorn PID: ${SERVER_PID}"
 
 # 5) Give the server a moment to start
 sleep 1
@@ -65,6 +66,6 @@ URL="http://127.0.0.1:${PORT}/"
 echo "🌐  Opening browser to ${URL}..."
 open "${URL}"
 
-echo "✅  Done. Django is running in the background (PID=${RUNSERVER_PID}),"
+echo "✅  Done. Django is running in the background (PID=${SERVER_PID}),"
 echo "    logs are being written to ${LOGFILE}."
-echo "    To stop the server, run: kill ${RUNSERVER_PID}"
+echo "    To stop the server, run: kill ${SERVER_PID}"
@@ -0,0 +1,89 @@
+"""
+Feed parsing helpers for the fetch_news command.
+
+Kept free of Django imports so parse_body can run in worker processes
+without setting up the ORM.
+"""
+import io
+import re
+from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+# Host part of an absolute URL; cheaper than a full urlparse per item
+_NETLOC_RE = re.compile(r"^[a-z][a-z0-9+.-]*://([^/?#]+)", re.I)
+
+
+def _local(tag):
+    # Strip any "{namespace}" prefix so RSS and Atom tags compare the same
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(el, name):
+    for child in el:
+        if _local(child.tag) != name:
+            continue
+        # Atom links carry the URL in href rather than element text
+        if name == "link" and child.get("href"):
+            if child.get("rel", "alternate") == "alternate":
+                return child.get("href").strip()
+            continue
+        if child.text and child.text.strip():
+            return child.text.strip()
+    return ""
+
+
+def _published(el):
+    """
+    Read the item's publish time as an aware UTC datetime; fallback to now if
+    missing or unparseable.
+    """
+    dt = None
+    raw = _child_text(el, "pubDate")
+    if raw:
+        try:
+            dt = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            dt = None
+    else:
+        raw = _child_text(el, "published") or _child_text(el, "updated") or _child_text(el, "date")
+        if raw:
+            try:
+                dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+            except ValueError:
+                dt = None
+    if dt is None:
+        return datetime.now(timezone.utc)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _iter_items(body):
+    """
+    Stream <item> (RSS) / <entry> (Atom) elements out of a feed body one at a
+    time, clearing each after use so memory stays flat on large feeds.
+    """
+    for _event, el in ElementTree.iterparse(io.BytesIO(body), events=("end",)):
+        if _local(el.tag) not in ("item", "entry"):
+            continue
+        link = _child_text(el, "link")
+        title = _child_text(el, "title")
+        if link and title:
+            m = _NETLOC_RE.match(link)
+            yield {
+                "headline": title,
+                "url": link,
+                "timestamp": _published(el),
+                "source": m.group(1) if m else "",
+            }
+        el.clear()
+
+
+def parse_body(body):
+    """
+    Parse a raw feed body into a list of NewsItem field dicts
+    (headline, url, timestamp, source). Parsing is strict XML: a malformed body
+    (e.g. an undefined entity like &nbsp;) raises ElementTree.ParseError.
+    """
+    return list(_iter_items(body))
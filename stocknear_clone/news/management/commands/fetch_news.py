@@ -1,8 +1,10 @@
-import feedparser
-from urllib.parse import urlparse
-from datetime import datetime, timezone
+import asyncio
+import os
+import aiohttp
+from concurrent.futures import ProcessPoolExecutor
 from django.core.management.base import BaseCommand
-from news.models import NewsItem
+from news.feeds import parse_body
+from news.models import NewsItem, url_sha1
 
 # List of RSS feed URLs to pull from
 RSS_SOURCES = [
@@ -11,43 +13,70 @@ RSS_SOURCES = [
     "https://seekingalpha.com/market_currents.xml",                                  # Seeking Alpha Market Currents
 ]
 
+
+async def _fetch_one(session, url):
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        return await resp.read()
+
+
+async def _fetch_all(urls):
+    """
+    Download every feed body concurrently. Returns a list of (url, body) where
+    body is the raw bytes, or the exception raised while fetching that feed.
+    """
+    timeout = aiohttp.ClientTimeout(total=15)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        tasks = [_fetch_one(session, u) for u in urls]
+        bodies = await asyncio.gather(*tasks, return_exceptions=True)
+    return list(zip(urls, bodies))
+
+
 class Command(BaseCommand):
     help = "Fetch latest items from predefined RSS feeds and store into NewsItem."
 
     def handle(self, *args, **options):
-        for feed_url in RSS_SOURCES:
-            self.stdout.write(f"Pulling feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries:
-                # Assume 'published_parsed' exists; fallback to now if missing
-                if hasattr(entry, "published_parsed"):
-                    published_dt = datetime.fromtimestamp(
-                        datetime(
-                            *entry.published_parsed[:6]
-                        ).timestamp(),
-                        tz=timezone.utc
-                    )
-                else:
-                    published_dt = datetime.now(timezone.utc)
-
-                link = entry.get("link", "").strip()
-                title = entry.get("title", "").strip()
-                if not link or not title:
-                    continue
-
-                domain = urlparse(link).netloc
-
-                # Avoid duplicates by URL
-                if NewsItem.objects.filter(url=link).exists():
-                    continue
-
-                # Create new NewsItem
-                NewsItem.objects.create(
-                    headline=title,
-                    url=link,
-                    timestamp=published_dt,
-                    source=domain,
-                )
-                self.stdout.write(f"  • Added: {title[:60]}...")
+        results = asyncio.run(_fetch_all(RSS_SOURCES))
+        bodies = []
+        for feed_url, body in results:
+            if isinstance(body, Exception):
+                self.stderr.write(f"  ! Error fetching {feed_url}: {body}")
+                continue
+            bodies.append((feed_url, body))
+
+        # Parsing is CPU-bound, so spread feeds across processes
+        entries = []
+        if bodies:
+            workers = min(len(bodies), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                futures = [(url, ex.submit(parse_body, body)) for url, body in bodies]
+                for feed_url, future in futures:
+                    self.stdout.write(f"Pulling feed: {feed_url}")
+                    try:
+                        parsed = future.result()
+                    except Exception as e:
+                        self.stderr.write(f"  ! Error processing {feed_url}: {e}")
+                        continue
+                    self.stdout.write(f"  • Parsed {len(parsed)} items")
+                    entries.extend(parsed)
+
+        # One indexed lookup for every link across all feeds instead of a
+        # per-entry exists() query; dedup is keyed on the narrow url_sha1
+        for entry in entries:
+            entry["url_sha1"] = url_sha1(entry["url"])
+        hashes = [e["url_sha1"] for e in entries]
+        existing = set(
+            NewsItem.objects.filter(url_sha1__in=hashes).values_list("url_sha1", flat=True)
+        )
+        items = []
+        for entry in entries:
+            # Avoid duplicates by URL (also across feeds in this run)
+            if entry["url_sha1"] in existing:
+                continue
+            existing.add(entry["url_sha1"])
+            items.append(NewsItem(**entry))
 
+        # ignore_conflicts covers rows inserted concurrently since the lookup
+        NewsItem.objects.bulk_create(items, batch_size=500, ignore_conflicts=True)
+        self.stdout.write(f"Added {len(items)} new items")
         self.stdout.write(self.style.SUCCESS("Done fetching RSS items."))
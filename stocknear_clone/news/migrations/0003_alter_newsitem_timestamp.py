@@ -0,0 +1,17 @@
+# Generated by Django 4.2.22 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0002_newsitem_source_alter_newsitem_url"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newsitem",
+            name="timestamp",
+            field=models.DateTimeField(db_index=True),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.22 on 2026-10-15 12:30
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def backfill_url_sha1(apps, schema_editor):
+    NewsItem = apps.get_model("news", "NewsItem")
+    items = list(NewsItem.objects.only("id", "url"))
+    for item in items:
+        item.url_sha1 = hashlib.sha1(item.url.encode()).hexdigest()
+    NewsItem.objects.bulk_update(items, ["url_sha1"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0003_alter_newsitem_timestamp"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsitem",
+            name="url_sha1",
+            field=models.CharField(editable=False, max_length=40, null=True),
+        ),
+        migrations.RunPython(backfill_url_sha1, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="newsitem",
+            name="url_sha1",
+            field=models.CharField(editable=False, max_length=40, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="newsitem",
+            name="url",
+            field=models.URLField(),
+        ),
+    ]
@@ -1,10 +1,44 @@
+import hashlib
+from django.core.exceptions import ValidationError
 from django.db import models
 
+def url_sha1(url):
+    """
+    Fixed-width dedup key for a news URL; keeps the unique index narrow.
+    """
+    return hashlib.sha1(url.encode()).hexdigest()
+
 class NewsItem(models.Model):
     headline = models.CharField(max_length=500)
-    url = models.URLField(unique=True)
-    timestamp = models.DateTimeField()
+    url = models.URLField()
+    url_sha1 = models.CharField(max_length=40, unique=True, editable=False)
+    timestamp = models.DateTimeField(db_index=True)
     source = models.CharField(max_length=255, null=True, blank=True)
 
+    def validate_unique(self, exclude=None):
+        """
+        url_sha1 isn't editable, so ModelForms skip its unique check; report a
+        duplicate on url instead of failing with an IntegrityError on save.
+        """
+        errors = {}
+        try:
+            super().validate_unique(exclude=exclude)
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if self.url and not (exclude and "url" in exclude):
+            dupes = NewsItem.objects.filter(url_sha1=url_sha1(self.url))
+            if self.pk is not None:
+                dupes = dupes.exclude(pk=self.pk)
+            if dupes.exists():
+                errors.setdefault("url", []).append(
+                    self.unique_error_message(NewsItem, ("url",))
+                )
+        if errors:
+            raise ValidationError(errors)
+
+    def save(self, *args, **kwargs):
+        self.url_sha1 = url_sha1(self.url)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.headline
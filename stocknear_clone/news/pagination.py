@@ -0,0 +1,26 @@
+import hashlib
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+COUNT_CACHE_TTL = 60
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the total row count for COUNT_CACHE_TTL seconds, so
+    listing pages don't run SELECT COUNT(*) over the whole table on every hit.
+    The count may lag recent inserts by up to the TTL.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is None:
+            return super().count
+        model = self.object_list.model
+        digest = hashlib.md5(str(query).encode()).hexdigest()
+        key = f"count:{model._meta.db_table}:{digest}"
+        return cache.get_or_set(key, self._uncached_count, COUNT_CACHE_TTL)
+
+    def _uncached_count(self):
+        return Paginator.count.func(self)
@@ -1,3 +1,122 @@
-from django.test import TestCase
+from datetime import datetime, timezone
+from io import StringIO
+from unittest import mock
+from xml.etree import ElementTree
 
-# Create your tests here.
+from django.core.management import call_command
+from django.forms import modelform_factory
+from django.test import SimpleTestCase, TestCase
+
+from .feeds import parse_body
+from .models import NewsItem
+
+
+def rss(items):
+    return (
+        '<?xml version="1.0"?>'
+        '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        f"<channel><title>Feed</title>{items}</channel></rss>"
+    ).encode()
+
+
+class ParseBodyTests(SimpleTestCase):
+    def test_rss_pubdate_with_offset(self):
+        body = rss(
+            "<item><title>Fed holds rates</title>"
+            "<link>https://www.cnbc.com/2025/06/10/fed.html</link>"
+            "<pubDate>Tue, 10 Jun 2025 14:00:00 -0400</pubDate></item>"
+        )
+        [item] = parse_body(body)
+        self.assertEqual(item["headline"], "Fed holds rates")
+        self.assertEqual(item["url"], "https://www.cnbc.com/2025/06/10/fed.html")
+        self.assertEqual(item["source"], "www.cnbc.com")
+        self.assertEqual(item["timestamp"], datetime(2025, 6, 10, 18, 0, tzinfo=timezone.utc))
+
+    def test_atom_entry_prefers_alternate_link(self):
+        body = (
+            b'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>'
+            b"<entry><title>Earnings beat</title>"
+            b'<link rel="self" href="https://example.com/feed/1"/>'
+            b'<link rel="alternate" href="https://example.com/news/1"/>'
+            b"<updated>2025-06-10T12:00:00Z</updated></entry></feed>"
+        )
+        [item] = parse_body(body)
+        self.assertEqual(item["url"], "https://example.com/news/1")
+        self.assertEqual(item["timestamp"], datetime(2025, 6, 10, 12, 0, tzinfo=timezone.utc))
+
+    def test_dc_date(self):
+        body = rss(
+            "<item><title>Oil slips</title><link>https://example.com/oil</link>"
+            "<dc:date>2025-06-10T12:00:00+02:00</dc:date></item>"
+        )
+        [item] = parse_body(body)
+        self.assertEqual(item["timestamp"], datetime(2025, 6, 10, 10, 0, tzinfo=timezone.utc))
+
+    def test_unparseable_date_falls_back_to_now(self):
+        body = rss(
+            "<item><title>No date</title><link>https://example.com/x</link>"
+            "<pubDate>sometime yesterday</pubDate></item>"
+        )
+        before = datetime.now(timezone.utc)
+        [item] = parse_body(body)
+        after = datetime.now(timezone.utc)
+        self.assertTrue(before <= item["timestamp"] <= after)
+
+    def test_skips_items_without_link_or_title(self):
+        body = rss(
+            "<item><title>No link</title></item>"
+            "<item><link>https://example.com/no-title</link></item>"
+        )
+        self.assertEqual(parse_body(body), [])
+
+    def test_malformed_body_raises(self):
+        # Strict XML: an undefined HTML entity fails the whole feed
+        body = rss("<item><title>Caf&nbsp;</title><link>https://example.com/c</link></item>")
+        with self.assertRaises(ElementTree.ParseError):
+            parse_body(body)
+
+
+class FetchNewsCommandTests(TestCase):
+    def test_malformed_feed_is_logged_and_others_still_stored(self):
+        good = rss(
+            "<item><title>Good item</title><link>https://example.com/good</link>"
+            "<pubDate>Tue, 10 Jun 2025 14:00:00 +0000</pubDate></item>"
+        )
+        bad = rss("<item><title>&nbsp;</title></item>")
+
+        async def fake_fetch_all(urls):
+            return [("https://good.example/rss", good), ("https://bad.example/rss", bad)]
+
+        out, err = StringIO(), StringIO()
+        with mock.patch("news.management.commands.fetch_news._fetch_all", fake_fetch_all):
+            call_command("fetch_news", stdout=out, stderr=err)
+
+        self.assertIn("Error processing https://bad.example/rss", err.getvalue())
+        self.assertEqual(list(NewsItem.objects.values_list("url", flat=True)), ["https://example.com/good"])
+
+
+class NewsItemUniqueUrlTests(TestCase):
+    def test_duplicate_url_is_a_form_error(self):
+        NewsItem.objects.create(
+            headline="First", url="https://example.com/a",
+            timestamp=datetime(2025, 6, 10, tzinfo=timezone.utc),
+        )
+        Form = modelform_factory(NewsItem, fields="__all__")
+        form = Form(data={
+            "headline": "Second", "url": "https://example.com/a",
+            "timestamp": "2025-06-11 00:00:00",
+        })
+        self.assertFalse(form.is_valid())
+        self.assertIn("url", form.errors)
+
+    def test_editing_an_item_keeps_its_own_url(self):
+        item = NewsItem.objects.create(
+            headline="First", url="https://example.com/a",
+            timestamp=datetime(2025, 6, 10, tzinfo=timezone.utc),
+        )
+        Form = modelform_factory(NewsItem, fields="__all__")
+        form = Form(instance=item, data={
+            "headline": "Renamed", "url": "https://example.com/a",
+            "timestamp": "2025-06-10 00:00:00",
+        })
+        self.assertTrue(form.is_valid(), form.errors)
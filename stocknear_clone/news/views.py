@@ -1,14 +1,29 @@
 from django.shortcuts import render
+from django.utils import timezone
 from django.utils.timesince import timesince
 from .models import NewsItem
+from .pagination import CachedCountPaginator
+
+NEWS_PER_PAGE = 50
 
 def news_feed(request):
     """
-    Show most recent news items, ordered newest-first. 
+    Show most recent news items, ordered newest-first, NEWS_PER_PAGE per page.
     Annotate each item with 'time_ago' for display.
     """
-    items = NewsItem.objects.order_by("-timestamp")[:50]
-    # Annotate a 'time_ago' string for each item
+    paginator = CachedCountPaginator(NewsItem.objects.order_by("-timestamp"), NEWS_PER_PAGE)
+    items = paginator.get_page(request.GET.get("page"))
+    # Annotate a 'time_ago' string for each item; common ranges are formatted
+    # inline against a single 'now', anything else falls back to timesince
+    now = timezone.now()
     for item in items:
-        item.time_ago = timesince(item.timestamp) + " ago"
+        delta = (now - item.timestamp).total_seconds()
+        if delta < 0 or delta >= 30 * 86400:
+            item.time_ago = timesince(item.timestamp, now) + " ago"
+        elif delta < 3600:
+            item.time_ago = f"{int(delta // 60)}m ago"
+        elif delta < 86400:
+            item.time_ago = f"{int(delta // 3600)}h ago"
+        else:
+            item.time_ago = f"{int(delta // 86400)}d ago"
     return render(request, "news/news_feed.html", {"items": items})
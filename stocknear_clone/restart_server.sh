@@ -5,7 +5,7 @@
 # This script will:
 #   1. Check if any process is listening on port 8000.
 #      If found, kill that process.
-#   2. Invoke launch_it.sh to start a new Django dev server on port 8000.
+#   2. Invoke launch_site.sh to start a new uvicorn (ASGI) server on port 8000.
 #
 # Usage:
 #   chmod +x restart_server.sh
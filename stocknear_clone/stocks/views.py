@@ -1,12 +1,157 @@
+import asyncio
 import os
+import ssl
+import certifi
+import httpx
 import requests
+from asgiref.sync import sync_to_async
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.core.cache import cache
 from django.shortcuts import render, get_object_or_404
 from django.http import Http404
 from .models import Stock
 
 FMP_API_KEY = os.environ.get("FMP_API_KEY", "")
 
-def stock_list(request):
+# One keep-alive session for sync FMP calls (fmp_probe) so TCP/TLS connections are reused
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+))
+
+# Async client for the read-only views. The app is served over ASGI (uvicorn),
+# so there is one long-lived loop and one keep-alive client. httpx pools are
+# tied to the loop that opened them, so if a view runs in a different loop
+# (e.g. under WSGI) the client is rebuilt, reusing one SSL context.
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+_ACLIENT = None
+_ACLIENT_LOOP = None
+
+async def _aclient():
+    global _ACLIENT, _ACLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _ACLIENT is not None and _ACLIENT_LOOP is loop:
+        return _ACLIENT
+    old = _ACLIENT
+    _ACLIENT = httpx.AsyncClient(
+        timeout=10,
+        transport=httpx.AsyncHTTPTransport(
+            verify=_SSL_CONTEXT,
+            limits=httpx.Limits(max_keepalive_connections=32),
+            retries=2,
+        ),
+    )
+    _ACLIENT_LOOP = loop
+    if old is not None:
+        try:
+            await old.aclose()
+        except Exception:
+            # its connections belonged to a loop that has already gone away
+            pass
+    return _ACLIENT
+
+GAINERS_CACHE_KEY = "fmp:gainers"
+GAINERS_CACHE_TTL = 60
+GAINERS_ERROR_TTL = 5
+# ETag/Last-Modified plus body, kept well past GAINERS_CACHE_TTL so a refresh
+# can be a conditional request answered with 304 Not Modified
+GAINERS_VALIDATORS_KEY = "fmp:gainers:validators"
+GAINERS_VALIDATORS_TTL = 24 * 60 * 60
+
+# Refresh lock: cache.add is atomic, so only one caller refetches on a miss and
+# concurrent requests (e.g. a list and a search landing together) wait for its
+# result. Works across requests and event loops, and across processes with Redis.
+GAINERS_LOCK_KEY = "fmp:gainers:lock"
+GAINERS_LOCK_TTL = 30
+GAINERS_WAIT_INTERVAL = 0.05
+
+async def _get_gainers():
+    """
+    Return the parsed FMP gainers list, shared across views for GAINERS_CACHE_TTL
+    seconds. Callers filter it in memory; only one refresh runs at a time.
+    """
+    data = await cache.aget(GAINERS_CACHE_KEY)
+    if data is not None:
+        return data
+    while not await cache.aadd(GAINERS_LOCK_KEY, True, GAINERS_LOCK_TTL):
+        # Someone else is refreshing; _refresh_gainers always fills the cache
+        # (with [] on failure), so poll until it lands or the lock goes away
+        await asyncio.sleep(GAINERS_WAIT_INTERVAL)
+        data = await cache.aget(GAINERS_CACHE_KEY)
+        if data is not None:
+            return data
+    try:
+        # the previous holder may have filled the cache just before we got the lock
+        data = await cache.aget(GAINERS_CACHE_KEY)
+        if data is not None:
+            return data
+        return await _refresh_gainers()
+    finally:
+        await cache.adelete(GAINERS_LOCK_KEY)
+
+async def _refresh_gainers():
+    """
+    Fetch gainers from FMP and cache them. Refreshes are conditional
+    (ETag/Last-Modified), reusing the stored body on 304. Failures cache an
+    empty list briefly so a flaky upstream isn't hammered.
+    """
+    url = f"https://financialmodelingprep.com/api/v3/stock_market/gainers?apikey={FMP_API_KEY}"
+    validators = await cache.aget(GAINERS_VALIDATORS_KEY)
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    try:
+        client = await _aclient()
+        resp = await client.get(url, headers=headers)
+        if resp.status_code == 304 and validators:
+            data = validators["body"]
+        else:
+            resp.raise_for_status()
+            data = resp.json()
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                await cache.aset(GAINERS_VALIDATORS_KEY, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "body": data,
+                }, GAINERS_VALIDATORS_TTL)
+    except Exception as e:
+        print(f"Error fetching FMP top gainers: {e}")
+        await cache.aset(GAINERS_CACHE_KEY, [], GAINERS_ERROR_TTL)
+        return []
+    await cache.aset(GAINERS_CACHE_KEY, data, GAINERS_CACHE_TTL)
+    return data
+
+PROBE_CACHE_KEY = "fmp:probe"
+PROBE_CACHE_TTL = 60
+
+def fmp_probe():
+    """
+    Cheap check that FMP is reachable with our API key. Successful probes are
+    cached for PROBE_CACHE_TTL seconds; failures are always re-checked.
+    """
+    if not FMP_API_KEY:
+        return False
+    if cache.get(PROBE_CACHE_KEY):
+        return True
+    url = f"https://financialmodelingprep.com/api/v3/quote-short/AAPL?apikey={FMP_API_KEY}"
+    try:
+        ok = _SESSION.get(url, timeout=5).ok
+    except Exception as e:
+        print(f"Error probing FMP: {e}")
+        ok = False
+    if ok:
+        cache.set(PROBE_CACHE_KEY, True, PROBE_CACHE_TTL)
+    return ok
+
+async def stock_list(request):
     """
     Fetch Top 100 Market Movers (gainers) from FMP using your API key.
     """
@@ -14,36 +159,21 @@ def stock_list(request):
         print("Error: FMP_API_KEY not set.")
         movers = []
     else:
-        url = f"https://financialmodelingprep.com/api/v3/stock_market/gainers?apikey={FMP_API_KEY}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            print(f"Error fetching FMP top gainers: {e}")
-            data = []
-        movers = data[:100]
-    return render(request, "stocks/stock_list.html", { "stocks": movers })
+        movers = (await _get_gainers())[:100]
+    # base.html touches request.user (session/DB), so render off the event loop
+    return await sync_to_async(render)(request, "stocks/stock_list.html", { "stocks": movers })
 
-def stock_search(request):
+async def stock_search(request):
     """
     Filter the FMP gainers list by a case-insensitive substring match on symbol.
     """
     q = request.GET.get("q", "").upper()
     results = []
     if q and FMP_API_KEY:
-        url = f"https://financialmodelingprep.com/api/v3/stock_market/gainers?apikey={FMP_API_KEY}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            all_data = resp.json()
-            results = [item for item in all_data if q in item.get("symbol", "")]
-        except Exception as e:
-            print(f"Error fetching FMP data for search: {e}")
-            results = []
-    return render(request, "stocks/stock_list.html", { "stocks": results, "query": q })
+        results = [item for item in await _get_gainers() if q in item.get("symbol", "")]
+    return await sync_to_async(render)(request, "stocks/stock_list.html", { "stocks": results, "query": q })
 
-def stock_detail(request, symbol):
+async def stock_detail(request, symbol):
     """
     Fetch real-time stock detail from FMP using `/quote/{symbol}` endpoint.
     """
@@ -52,7 +182,8 @@ def stock_detail(request, symbol):
         raise Http404("API key not configured.")
     url = f"https://financialmodelingprep.com/api/v3/quote/{symbol}?apikey={FMP_API_KEY}"
     try:
-        resp = requests.get(url, timeout=10)
+        client = await _aclient()
+        resp = await client.get(url)
         resp.raise_for_status()
         data = resp.json()
         if not data:
@@ -63,7 +194,7 @@ def stock_detail(request, symbol):
     except Exception as e:
         print(f"Error fetching FMP detail for {symbol}: {e}")
         raise Http404(f"Could not retrieve data for {symbol}")
-    return render(request, "stocks/stock_detail.html", { "stock": stock_data })
+    return await sync_to_async(render)(request, "stocks/stock_detail.html", { "stock": stock_data })
 
 def stock_overview(request):
     """